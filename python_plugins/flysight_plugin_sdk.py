@@ -50,22 +50,28 @@ For more complex calculations, subclass AttributePlugin or MeasurementPlugin
 and implement the `inputs()` and `compute()` methods.
 """
 from __future__ import annotations
+import functools
+import time
 import numpy as np
-from datetime import datetime, timezone
 from dataclasses import dataclass
-from typing import List, Union, Optional
+from typing import Dict, List, Tuple, Union, Optional
+from numpy.typing import NDArray
 # Pull in the C++ bridge for DependencyKey
 from flysight_cpp_bridge import DependencyKey
 
 
 # ─── internal registries ────────────────────────────────────────────────
-_attributes:   List[AttributePlugin]   = []
-_measurements: List[MeasurementPlugin] = []
-_simple_plots: List[SimplePlot]        = []
-_markers:      List[SimpleMarker]      = []
+# Keyed by what each entry produces, so registering the same key again
+# replaces the earlier entry. The host iterates the values.
+_attributes:   Dict[Tuple[Optional[str], str], AttributePlugin] = {}
+_measurements: Dict[Tuple[str, str], MeasurementPlugin]         = {}
+_simple_plots: Dict[Tuple[str, str], SimplePlot]                = {}
+_markers:      Dict[str, SimpleMarker]                          = {}
 
 
 # ─── helpers to construct DependencyKey ─────────────────────────────────
+# Keys are shared between callers, so treat the returned objects as read-only.
+@functools.lru_cache(maxsize=None)
 def meas(sensor: str, name: str) -> DependencyKey:
     k = DependencyKey()
     k.kind            = DependencyKey.Type.Measurement
@@ -73,6 +79,7 @@ def meas(sensor: str, name: str) -> DependencyKey:
     k.measurementKey  = name
     return k
 
+@functools.lru_cache(maxsize=None)
 def attr(name: str) -> DependencyKey:
     k = DependencyKey()
     k.kind           = DependencyKey.Type.Attribute
@@ -80,9 +87,37 @@ def attr(name: str) -> DependencyKey:
     return k
 
 
+# ─── helpers to read session data ──────────────────────────────────────
+def get_measurements(session, keys: List[DependencyKey]) -> List[Optional[NDArray[np.float64]]]:
+    """Fetch several measurements with a single call into the C++ session.
+
+    Returns one read-only float64 array per key, in order, or None where
+    the key is not a measurement or the measurement is missing.
+    """
+    return session.getMeasurements(keys)
+
+def _get_meas_array(session, sensor: str, name: str) -> Optional[NDArray[np.float64]]:
+    """Return a measurement as a float64 array, or None if it is empty."""
+    data = session.getMeasurement(sensor, name)
+    if len(data) == 0:
+        return None
+    if isinstance(data, np.ndarray) and data.dtype == np.float64:
+        return data
+    return np.asarray(data, dtype=np.float64)
+
+def _epoch_to_iso_z(sec: float) -> str:
+    """Format UTC seconds as ISO-8601 with microseconds and a Z suffix."""
+    whole, frac = divmod(sec, 1.0)
+    us = round(frac * 1e6)
+    if us == 1_000_000:
+        whole, us = whole + 1, 0
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(whole)) + f".{us:06d}Z"
+
+
 # ─── base classes for plug-ins ─────────────────────────────────────────
 class AttributePlugin:
     """Return a single QVariant-compatible value or small NumPy array."""
+    __slots__ = ("name", "sensor")
     name:  str
     units: Optional[str] = None
 
@@ -93,10 +128,16 @@ class AttributePlugin:
         raise NotImplementedError
 
 def register_attribute(plugin: AttributePlugin) -> None:
-    _attributes.append(plugin)
+    _attributes[(getattr(plugin, "sensor", None), plugin.name)] = plugin
 
 class MeasurementPlugin:
-    """Return a full-length NumPy array (one value per sample)."""
+    """Return a full-length NumPy array (one value per sample).
+
+    The host copies the result straight out of the array buffer when it is
+    already a C-contiguous float64 array; any other dtype or layout is
+    converted first.
+    """
+    __slots__ = ("name", "sensor")
     name:   str
     units:  Optional[str] = None
     sensor: str
@@ -104,13 +145,13 @@ class MeasurementPlugin:
     def inputs(self) -> List[DependencyKey]:
         return []
 
-    def compute(self, session) -> np.ndarray:
+    def compute(self, session) -> Optional[NDArray[np.float64]]:
         raise NotImplementedError
 
 def register_measurement(plugin: MeasurementPlugin) -> None:
-    _measurements.append(plugin)
+    _measurements[(plugin.sensor, plugin.name)] = plugin
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SimplePlot:
     """
     Defines a simple plot that displays a measurement from SessionData.
@@ -165,10 +206,14 @@ class SimplePlot:
     measurement_type: Optional[str] = None
 
 def register_plot(meta: SimplePlot) -> None:
-    _simple_plots.append(meta)
+    _simple_plots[(meta.sensor, meta.measurement)] = meta
 
+def get_plots() -> Tuple[SimplePlot, ...]:
+    """Return the registered plots, in registration order."""
+    return tuple(_simple_plots.values())
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SimpleMarker:
     """
     Defines a simple marker that appears on the plot as a reference or analysis point.
@@ -201,24 +246,29 @@ class SimpleMarker:
     editable:      bool = False
 
 def register_marker(meta: SimpleMarker) -> None:
-    _markers.append(meta)
+    _markers[meta.attribute_key] = meta
+
+def get_markers() -> Tuple[SimpleMarker, ...]:
+    """Return the registered markers, in registration order."""
+    return tuple(_markers.values())
 
 
 # ─── default plug-ins ──────────────────────────────────────────────────
 class DefaultStartTime(AttributePlugin):
+    __slots__ = ()
     def __init__(self, sensor: str):
         self.name   = "_START_TIME"
         self.sensor = sensor
     def inputs(self):
         return [ meas(self.sensor, "_time") ]
     def compute(self, session):
-        times = np.array(session.getMeasurement(self.sensor, "_time"), float)
-        if times.size == 0: return None
-        t0 = float(times.min())
-        dt = datetime.fromtimestamp(t0, tz=timezone.utc)
-        return dt.isoformat().replace("+00:00","Z")
+        times = session.getMeasurement(self.sensor, "_time")
+        if len(times) == 0: return None
+        t0 = float(times[0])
+        return _epoch_to_iso_z(t0)
 
 class DefaultDuration(AttributePlugin):
+    __slots__ = ()
     units = "s"
     def __init__(self, sensor: str):
         self.name   = "_DURATION"
@@ -226,25 +276,26 @@ class DefaultDuration(AttributePlugin):
     def inputs(self):
         return [ meas(self.sensor, "_time") ]
     def compute(self, session):
-        times = np.array(session.getMeasurement(self.sensor, "_time"), float)
-        if times.size == 0: return None
-        dur = float(times.max() - times.min())
+        times = session.getMeasurement(self.sensor, "_time")
+        if len(times) == 0: return None
+        dur = float(times[-1] - times[0])
         return dur if dur>=0 else None
 
 class DefaultExitTime(AttributePlugin):
+    __slots__ = ()
     def __init__(self, sensor: str):
         self.name   = "_EXIT_TIME"
         self.sensor = sensor
     def inputs(self):
         return [ meas(self.sensor, "_time") ]
     def compute(self, session):
-        times = np.array(session.getMeasurement(self.sensor, "_time"), float)
-        if times.size == 0: return None
+        times = session.getMeasurement(self.sensor, "_time")
+        if len(times) == 0: return None
         t0 = float(times[-1])
-        dt = datetime.fromtimestamp(t0, tz=timezone.utc)
-        return dt.isoformat().replace("+00:00","Z")
+        return _epoch_to_iso_z(t0)
 
 class DefaultTime(MeasurementPlugin):
+    __slots__ = ("time",)
     units = "s"
     def __init__(self, sensor: str, time: str):
         self.name   = "_time"
@@ -255,7 +306,5 @@ class DefaultTime(MeasurementPlugin):
             meas(self.sensor, self.time),
         ]
     def compute(self, session):
-        raw = np.array(session.getMeasurement(self.sensor, self.time), float)
-        if raw.size==0: return None
-        return raw 
+        return _get_meas_array(session, self.sensor, self.time)
 
@@ -274,7 +274,7 @@ void PluginHost::initialise(const QString& pluginDir)
     /* ------------------------------------------------------------------ */
     /* 4.  Register calculated attributes                                 */
     /* ------------------------------------------------------------------ */
-    for (py::handle h : sdk.attr("_attributes")) {
+    for (py::handle h : sdk.attr("_attributes").attr("values")()) {
         py::object plugin = h.cast<py::object>();
         const QString key =
             QString::fromStdString(plugin.attr("name").cast<std::string>());
@@ -326,7 +326,7 @@ void PluginHost::initialise(const QString& pluginDir)
     /* ------------------------------------------------------------------ */
     /* 5.  Register calculated measurements                               */
     /* ------------------------------------------------------------------ */
-    for (py::handle h : sdk.attr("_measurements")) {
+    for (py::handle h : sdk.attr("_measurements").attr("values")()) {
         py::object plugin = h.cast<py::object>();
         const QString sensor =
             QString::fromStdString(plugin.attr("sensor").cast<std::string>());
@@ -366,7 +366,7 @@ void PluginHost::initialise(const QString& pluginDir)
     /* ------------------------------------------------------------------ */
     /* 6.  Register simple plot definitions                               */
     /* ------------------------------------------------------------------ */
-    for (py::handle h : sdk.attr("_simple_plots")) {
+    for (py::handle h : sdk.attr("get_plots")()) {
         py::object plt = h.cast<py::object>();
         PlotRegistry::instance().registerPlot({
             QString::fromStdString(plt.attr("category").cast<std::string>()),
@@ -388,7 +388,7 @@ void PluginHost::initialise(const QString& pluginDir)
     /* ------------------------------------------------------------------ */
     /* 6b. Register simple marker definitions                             */
     /* ------------------------------------------------------------------ */
-    for (py::handle h : sdk.attr("_markers")) {
+    for (py::handle h : sdk.attr("get_markers")()) {
         py::object mk = h.cast<py::object>();
 
         MarkerDefinition def;
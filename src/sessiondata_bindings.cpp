@@ -4,10 +4,31 @@
 #include <QString>
 #include <QVariant>
 #include "sessiondata.h"
+#include "dependencykey.h"
 
 namespace py = pybind11;
 using namespace FlySight;
 
+namespace {
+
+// Expose a measurement vector to Python as a read-only float64 array without
+// copying the samples. The capsule owns a QVector that shares storage with
+// the session (implicit sharing), keeping it alive as long as the array is.
+// The array is read-only because writes would otherwise reach the session's
+// own copy through the shared buffer.
+py::array_t<double> measurementArray(QVector<double> data)
+{
+    auto *owner = new QVector<double>(std::move(data));
+    py::capsule base(owner, [](void *p) {
+        delete static_cast<QVector<double> *>(p);
+    });
+    py::array_t<double> arr(owner->size(), owner->constData(), base);
+    arr.attr("setflags")(py::arg("write") = false);
+    return arr;
+}
+
+} // namespace
+
 void register_sessiondata(py::module_ &m) {
     py::class_<SessionData>(m, "SessionData")
         .def("setCalculatedMeasurement",
@@ -46,20 +67,44 @@ void register_sessiondata(py::module_ &m) {
              "Sets a calculated measurement value directly into the session's C++ cache. "
              "Use with caution, intended for plugins that compute multiple related outputs at once.")
 
-        // session.getMeasurement(sensor, measurement) → list[float]
+        // session.getMeasurement(sensor, measurement) → read-only float64 ndarray
         .def("getMeasurement",
              [](SessionData &self,
                 std::string sensor,
                 std::string measurement)
              {
-                 auto qv = self.getMeasurement(
+                 return measurementArray(self.getMeasurement(
                      QString::fromStdString(sensor),
-                     QString::fromStdString(measurement));
-                 return std::vector<double>(qv.begin(), qv.end());
+                     QString::fromStdString(measurement)));
              },
              py::arg("sensorKey"),
              py::arg("measurementKey"))
 
+        // session.getMeasurements([DependencyKey, ...]) → list[ndarray | None]
+        .def("getMeasurements",
+             [](SessionData &self, const std::vector<DependencyKey> &keys)
+             {
+                 py::list out;
+                 for (const DependencyKey &key : keys) {
+                     if (key.type != DependencyKey::Type::Measurement) {
+                         out.append(py::none());
+                         continue;
+                     }
+                     QVector<double> qv = self.getMeasurement(
+                         key.measurementKey.first,
+                         key.measurementKey.second);
+                     if (qv.isEmpty()) {
+                         out.append(py::none());
+                         continue;
+                     }
+                     out.append(measurementArray(std::move(qv)));
+                 }
+                 return out;
+             },
+             py::arg("keys"),
+             "Fetches several measurements in one call. Returns one read-only float64 array "
+             "per key, or None where the key is not a measurement or the measurement is empty.")
+
         // session.getAttribute(key) → float, str, or None
         .def("getAttribute",
              [](SessionData &self, std::string key) -> py::object {